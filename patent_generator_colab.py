@@ -29,7 +29,7 @@ Output: Alokick_Global_Patent_Final_v8.pdf
 # =============================================================================
 # CELL 1: INSTALL
 # =============================================================================
-!pip install PyMuPDF reportlab Pillow --quiet
+!pip install PyMuPDF reportlab Pillow pyahocorasick google-re2 --quiet
 
 # =============================================================================
 # CELL 2: IMPORTS
@@ -45,11 +45,29 @@ from reportlab.platypus import (
     Table, TableStyle, KeepTogether
 )
 from reportlab.lib import colors
+from reportlab import rl_config
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from io import BytesIO
 from PIL import Image as PILImage
+import copy
+import multiprocessing
 import re
 import os
 
+try:
+    import ahocorasick  # optional: single-pass figure keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # optional: linear-time scans for the reference-phrase patterns
+except ImportError:
+    re2 = None
+
 print("✓ Imports successful")
 
 # =============================================================================
@@ -72,6 +90,10 @@ FONT_SIZE = 12
 LINE_HEIGHT = 18  # 1.5x line spacing
 PARA_SPACE = 12
 
+# Store image/page streams as binary Flate instead of ASCII85: the pure-Python
+# A85 encoder (used when rl_accel is absent) dominated build time for photos
+rl_config.useA85 = 0
+
 print("=" * 70)
 print("ALOKICK PATENT GENERATOR - v8 (Attorney-Ready)")
 print(f"Output: {OUTPUT_PDF}")
@@ -208,26 +230,150 @@ FIGURES = [
 # CELL 5: COMPREHENSIVE FIGURE REFERENCE FIXER
 # =============================================================================
 
+# Flat (keyword, " keyword ", base score, fig num) rows in FIGURES order
+KEYWORD_TABLE = tuple(
+    (keyword, f" {keyword} ", len(keyword) * 2, fig['num'])
+    for fig in FIGURES
+    for keyword in fig['keywords']
+)
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over every KEYWORD_TABLE keyword."""
+    automaton = ahocorasick.Automaton()
+    for order, (keyword, _, _, fig_num) in enumerate(KEYWORD_TABLE):
+        automaton.add_word(keyword, (order, len(keyword), fig_num))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick else None
+
+def _best_figure_from_automaton(context_lower):
+    """Single pass over the context; same scores and tie-breaks as the keyword loop."""
+    last = len(context_lower) - 1
+    best_key = (0, 0)
+    best_fig = 1
+    
+    for end, (order, length, fig_num) in KEYWORD_AUTOMATON.iter(context_lower):
+        start = end - length + 1
+        score = length * 2  # Weight by keyword length
+        # Bonus for exact phrase matches
+        if (start == 0 or context_lower[start - 1] == ' ') and (end == last or context_lower[end + 1] == ' '):
+            score += 5
+        # Earlier keywords win ties, as in the KEYWORD_TABLE loop
+        if (score, -order) > best_key:
+            best_key = (score, -order)
+            best_fig = fig_num
+    
+    return best_fig
+
+@lru_cache(maxsize=1024)
 def get_figure_number_from_context(context_text):
     """Determine the best figure number based on surrounding context keywords."""
     context_lower = context_text.lower()
+    if KEYWORD_AUTOMATON is not None:
+        return _best_figure_from_automaton(context_lower)
     
     best_fig = 1
     best_score = 0
-    
-    for fig in FIGURES:
-        for keyword in fig['keywords']:
-            if keyword in context_lower:
-                score = len(keyword) * 2  # Weight by keyword length
-                # Bonus for exact phrase matches
-                if f" {keyword} " in f" {context_lower} ":
-                    score += 5
-                if score > best_score:
-                    best_score = score
-                    best_fig = fig['num']
+    padded = f" {context_lower} "
+    
+    for keyword, bounded, base_score, fig_num in KEYWORD_TABLE:
+        if keyword in context_lower:
+            score = base_score  # Weight by keyword length
+            # Bonus for exact phrase matches
+            if bounded in padded:
+                score += 5
+            if score > best_score:
+                best_score = score
+                best_fig = fig_num
     
     return best_fig
 
+# Figure-reference patterns used by fix_all_figure_references, compiled once at import
+RE_FIG_DUP = re.compile(r'FIG\.?\s+FIG\.?\s*(\d+)', re.IGNORECASE)
+RE_FIG_DUP_BARE = re.compile(r'FIG\s+FIG\s+', re.IGNORECASE)
+RE_FIG_MALFORMED = re.compile(r'FIG\.?\s*(\d{1,2})(?:\s*\.\s*\d+)+\.?', re.IGNORECASE)
+RE_FIG_TWO_NUMS = re.compile(r'FIG\.?\s*(\d{1,2})\s*\.\s*\d+(?!\d)', re.IGNORECASE)
+
+# Python's \s for str patterns (RE2's is ASCII-only), in RE2 syntax
+RE2_WHITESPACE = r'[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]'
+# Patterns RE2 cannot take verbatim: other escapes, (?...) other than (?:, classes with an i
+RE2_UNSAFE = re.compile(r'\\[^s.]|\(\?[^:]|\[[^\]]*[iI]')
+
+def compile_ref_pattern(pattern):
+    """
+    Compile a case-insensitive reference pattern, with RE2 when it is installed
+    and the pattern is simple enough to translate exactly; otherwise with re.
+    """
+    if re2 is None or RE2_UNSAFE.search(pattern):
+        return re.compile(pattern, re.IGNORECASE)
+    # re.IGNORECASE also matches İ and ı to i; RE2's case folding does not
+    translated = pattern.replace('i', '[iİı]').replace('I', '[iİı]')
+    options = re2.Options()
+    options.case_sensitive = False
+    return re2.compile(translated.replace(r'\s', RE2_WHITESPACE), options)
+
+# Empty references (as shown in . → as shown in FIG. X.) with their prefix group
+# and the lowercase words, one of which must be present for the pattern to match
+EMPTY_REF_PATTERNS = [(compile_ref_pattern(p), g, words) for p, g, words in [
+    (r'((?:as\s+)?shown\s+in)\s*\.', 1, ('shown',)),
+    (r'((?:as\s+)?illustrated\s+in)\s*\.', 1, ('illustrated',)),
+    (r'((?:as\s+)?depicted\s+in)\s*\.', 1, ('depicted',)),
+    (r'((?:as\s+)?displayed\s+in)\s*\.', 1, ('displayed',)),
+    (r'((?:as\s+)?presented\s+in)\s*\.', 1, ('presented',)),
+    (r'(represented\s+(?:visually\s+)?in)\s*\.', 1, ('represented',)),
+    (r'((?:These\s+are\s+)?(?:represented|shown)\s+visually\s+in)\s*\.', 1, ('visually',)),
+    (r'((?:A\s+)?visual\s+reference\s+(?:for\s+\w+\s+)?is\s+shown\s+in)\s*\.', 1, ('reference',)),
+    (r'((?:See|Refer\s+to))\s*\.', 1, ('see', 'refer')),
+    (r'(in\s+FIG\.?)\s*\.', 1, ('fig',)),
+]]
+
+RE_FIG_AND_EMPTY = re.compile(r'FIG\.?\s*(\d{1,2})\s+and\s*\.', re.IGNORECASE)
+RE_FIGURE_WORD = re.compile(r'Figure\s+(\d{1,2})', re.IGNORECASE)
+RE_FIG_SPACING = re.compile(r'FIG(?:\s+|\.(?:\s{2,})?)(\d)')
+RE_FIG_STANDALONE = re.compile(r'FIG\.\s*\.(?!\d)', re.IGNORECASE)
+RE_FIG_NUMBER = re.compile(r'FIG\.\s*(\d+)', re.IGNORECASE)
+RE_FIG_DUP_WORD = re.compile(r'FIG\s+FIG', re.IGNORECASE)
+RE_FIG_FORMAT = re.compile(r'FIG\s*\.\s*(\d+)')
+
+# Implicit references (phrase followed by article/description, not FIG)
+IMPLICIT_REF_PATTERNS = [(compile_ref_pattern(p), words) for p, words in [
+    (r'((?:as\s+)?illustrated\s+in)\s+(the\s+\w+)', ('illustrated',)),
+    (r'((?:as\s+)?shown\s+in)\s+(the\s+\w+)', ('shown',)),
+    (r'((?:as\s+)?depicted\s+in)\s+(the\s+\w+)', ('depicted',)),
+    (r'((?:as\s+)?displayed\s+in)\s+(the\s+\w+)', ('displayed',)),
+    (r'(represented\s+visually\s+in)\s+(the\s+\w+)', ('represented',)),
+    (r'((?:as\s+)?illustrated\s+in)\s+([a-z]+\s+\w+)', ('illustrated',)),
+    (r'((?:as\s+)?shown\s+in)\s+([a-z]+\s+\w+)', ('shown',)),
+]]
+
+# References ending with comma or period without figure
+TRAILING_REF_PATTERNS = [(compile_ref_pattern(p), words) for p, words in [
+    (r'((?:as\s+)?illustrated\s+in)\s*([,\.])', ('illustrated',)),
+    (r'((?:as\s+)?shown\s+in)\s*([,\.])', ('shown',)),
+    (r'((?:as\s+)?depicted\s+in)\s*([,\.])', ('depicted',)),
+    (r'(represented\s+visually\s+in)\s*([,\.])', ('represented',)),
+]]
+
+RE_IN_FIG_NO_NUM = re.compile(r'in\s+FIG\.(?!\s*\d)', re.IGNORECASE)
+RE_FIG_DOUBLE_PUNCT = re.compile(r'FIG\.\s+(\d+)\s*(?:(,)\s*,|(\.)\s*\.)')
+RE_MULTI_SPACE = re.compile(r'\s{2,}')
+
+# Every step below needs one of these literals; text without any is returned as-is
+RE_FIGURE_PROBE = re.compile(
+    r'fig|shown|illustrated|depicted|displayed|presented|represented|see|refer|\s\s',
+    re.IGNORECASE
+)
+
+# re.IGNORECASE also matches these non-ASCII letters to i/s/k; fold them before lower()
+PROBE_FOLD_TABLE = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+def fold_for_probe(text):
+    """Lowercase text for substring probes, folding the letters above only when present."""
+    if not text.isascii() and any(chr(c) in text for c in PROBE_FOLD_TABLE):
+        text = text.translate(PROBE_FOLD_TABLE)
+    return text.lower()
+
 def fix_all_figure_references(text):
     """
     Comprehensive figure reference repair:
@@ -239,15 +385,28 @@ def fix_all_figure_references(text):
     6. Fix duplications (FIG FIG. X → FIG. X)
     """
     
-    # STEP 0: Fix "FIG FIG." duplications first (before other processing)
-    text = re.sub(r'FIG\.?\s+FIG\.?\s*(\d+)', r'FIG. \1', text, flags=re.IGNORECASE)
-    text = re.sub(r'FIG\s+FIG\s+', 'FIG. ', text, flags=re.IGNORECASE)
+    if not RE_FIGURE_PROBE.search(text):
+        return text
+    
+    # Cheap substring probes so each step only scans when it could match.
+    # No step creates the probe words, but several insert "FIG", so has_fig
+    # is raised whenever one of those steps makes a substitution.
+    folded = fold_for_probe(text)
+    has_fig = 'fig' in folded
     
-    # STEP 1: Fix severely malformed patterns like "FIG. 1. 1." or "FIG. 17. 6. 6."
-    text = re.sub(r'FIG\.?\s*(\d{1,2})(?:\s*\.\s*\d+)+\.?', r'FIG. \1', text, flags=re.IGNORECASE)
+    def present(words):
+        return any(has_fig if w == 'fig' else w in folded for w in words)
     
-    # STEP 2: Fix "FIG. X. Y" (two numbers)
-    text = re.sub(r'FIG\.?\s*(\d{1,2})\s*\.\s*\d+(?!\d)', r'FIG. \1', text, flags=re.IGNORECASE)
+    if has_fig:
+        # STEP 0: Fix "FIG FIG." duplications first (before other processing)
+        text = RE_FIG_DUP.sub(r'FIG. \1', text)
+        text = RE_FIG_DUP_BARE.sub('FIG. ', text)
+        
+        # STEP 1: Fix severely malformed patterns like "FIG. 1. 1." or "FIG. 17. 6. 6."
+        text = RE_FIG_MALFORMED.sub(r'FIG. \1', text)
+        
+        # STEP 2: Fix "FIG. X. Y" (two numbers)
+        text = RE_FIG_TWO_NUMS.sub(r'FIG. \1', text)
     
     # STEP 3: Context-aware replacement for empty references
     def context_replace(match, prefix_group=1):
@@ -266,26 +425,10 @@ def fix_all_figure_references(text):
         else:
             return f"{prefix_clean} FIG. {fig_num}."
     
-    # Pattern list for empty references
-    empty_patterns = [
-        (r'((?:as\s+)?shown\s+in)\s*\.', 1),
-        (r'((?:as\s+)?illustrated\s+in)\s*\.', 1),
-        (r'((?:as\s+)?depicted\s+in)\s*\.', 1),
-        (r'((?:as\s+)?displayed\s+in)\s*\.', 1),
-        (r'((?:as\s+)?presented\s+in)\s*\.', 1),
-        (r'(represented\s+(?:visually\s+)?in)\s*\.', 1),
-        (r'((?:These\s+are\s+)?(?:represented|shown)\s+visually\s+in)\s*\.', 1),
-        (r'((?:A\s+)?visual\s+reference\s+(?:for\s+\w+\s+)?is\s+shown\s+in)\s*\.', 1),
-        (r'((?:See|Refer\s+to))\s*\.', 1),
-        (r'(in\s+FIG\.?)\s*\.', 1),
-    ]
-    
-    for pattern, group in empty_patterns:
-        def make_replacer(grp):
-            def replacer(m):
-                return context_replace(m, grp)
-            return replacer
-        text = re.sub(pattern, make_replacer(group), text, flags=re.IGNORECASE)
+    for pattern, group, words in EMPTY_REF_PATTERNS:
+        if present(words):
+            text, count = pattern.subn(partial(context_replace, prefix_group=group), text)
+            has_fig = has_fig or count > 0
     
     # STEP 4: Fix "FIG. X and ." (missing second figure)
     def fix_and_empty(match):
@@ -298,15 +441,15 @@ def fix_all_figure_references(text):
             second_fig = min(first_fig + 1, 17)
         return f"FIG. {first_fig} and FIG. {second_fig}."
     
-    text = re.sub(r'FIG\.?\s*(\d{1,2})\s+and\s*\.', fix_and_empty, text, flags=re.IGNORECASE)
-    
-    # STEP 5: Normalize "Figure X" to "FIG. X"
-    text = re.sub(r'Figure\s+(\d{1,2})', r'FIG. \1', text, flags=re.IGNORECASE)
-    
-    # STEP 6: Normalize FIG spacing
-    text = re.sub(r'FIG\s+(\d)', r'FIG. \1', text)
-    text = re.sub(r'FIG\.(\d)', r'FIG. \1', text)
-    text = re.sub(r'FIG\.\s{2,}(\d)', r'FIG. \1', text)
+    if has_fig:
+        text = RE_FIG_AND_EMPTY.sub(fix_and_empty, text)
+        
+        # STEP 5: Normalize "Figure X" to "FIG. X"
+        if 'figure' in folded:
+            text = RE_FIGURE_WORD.sub(r'FIG. \1', text)
+        
+        # STEP 6: Normalize FIG spacing ("FIG 1", "FIG.1", "FIG.  1" in one pass)
+        text = RE_FIG_SPACING.sub(r'FIG. \1', text)
     
     # STEP 7: Fix standalone "FIG. ." without number
     def fix_standalone_fig(match):
@@ -315,25 +458,24 @@ def fix_all_figure_references(text):
         fig_num = get_figure_number_from_context(context)
         return f'FIG. {fig_num}.'
     
-    text = re.sub(r'FIG\.\s*\.(?!\d)', fix_standalone_fig, text, flags=re.IGNORECASE)
+    if has_fig:
+        text = RE_FIG_STANDALONE.sub(fix_standalone_fig, text)
     
     # STEP 8: Validate figure numbers (wrap invalid to valid range)
     def validate_fig(match):
-        num = int(match.group(1))
-        if num < 1:
-            num = 1
-        elif num > 17:
-            num = ((num - 1) % 17) + 1
+        # 0 → 1, 1-17 unchanged, above 17 wraps back into range
+        num = (max(int(match.group(1)), 1) - 1) % 17 + 1
         return f'FIG. {num}'
     
-    text = re.sub(r'FIG\.\s*(\d+)', validate_fig, text, flags=re.IGNORECASE)
-    
-    # STEP 9: Final cleanup - remove any remaining FIG duplications
-    text = re.sub(r'FIG\.?\s+FIG\.?\s*(\d+)', r'FIG. \1', text, flags=re.IGNORECASE)
-    text = re.sub(r'FIG\s+FIG', 'FIG', text, flags=re.IGNORECASE)
-    
-    # STEP 10: Ensure consistent formatting "FIG. X" (single space, period)
-    text = re.sub(r'FIG\s*\.\s*(\d+)', r'FIG. \1', text)
+    if has_fig:
+        text = RE_FIG_NUMBER.sub(validate_fig, text)
+        
+        # STEP 9: Final cleanup - remove any remaining FIG duplications
+        text = RE_FIG_DUP.sub(r'FIG. \1', text)
+        text = RE_FIG_DUP_WORD.sub('FIG', text)
+        
+        # STEP 10: Ensure consistent formatting "FIG. X" (single space, period)
+        text = RE_FIG_FORMAT.sub(r'FIG. \1', text)
     
     # STEP 11: Fix IMPLICIT references - "as illustrated in the" without FIG number
     # These are references that mention illustration but don't specify which figure
@@ -355,19 +497,10 @@ def fix_all_figure_references(text):
         # Insert FIG reference
         return f"{phrase} FIG. {fig_num}, {following.lstrip()}"
     
-    # Patterns for implicit references (phrase followed by article/description, not FIG)
-    implicit_patterns = [
-        r'((?:as\s+)?illustrated\s+in)\s+(the\s+\w+)',
-        r'((?:as\s+)?shown\s+in)\s+(the\s+\w+)',
-        r'((?:as\s+)?depicted\s+in)\s+(the\s+\w+)',
-        r'((?:as\s+)?displayed\s+in)\s+(the\s+\w+)',
-        r'(represented\s+visually\s+in)\s+(the\s+\w+)',
-        r'((?:as\s+)?illustrated\s+in)\s+([a-z]+\s+\w+)',
-        r'((?:as\s+)?shown\s+in)\s+([a-z]+\s+\w+)',
-    ]
-    
-    for pattern in implicit_patterns:
-        text = re.sub(pattern, fix_implicit_reference, text, flags=re.IGNORECASE)
+    for pattern, words in IMPLICIT_REF_PATTERNS:
+        if present(words):
+            text, count = pattern.subn(fix_implicit_reference, text)
+            has_fig = has_fig or count > 0
     
     # STEP 12: Fix references ending with comma or period without figure
     def fix_trailing_implicit(match):
@@ -380,15 +513,10 @@ def fix_all_figure_references(text):
         
         return f"{phrase} FIG. {fig_num}{punct}"
     
-    trailing_patterns = [
-        r'((?:as\s+)?illustrated\s+in)\s*([,\.])',
-        r'((?:as\s+)?shown\s+in)\s*([,\.])',
-        r'((?:as\s+)?depicted\s+in)\s*([,\.])',
-        r'(represented\s+visually\s+in)\s*([,\.])',
-    ]
-    
-    for pattern in trailing_patterns:
-        text = re.sub(pattern, fix_trailing_implicit, text, flags=re.IGNORECASE)
+    for pattern, words in TRAILING_REF_PATTERNS:
+        if present(words):
+            text, count = pattern.subn(fix_trailing_implicit, text)
+            has_fig = has_fig or count > 0
     
     # STEP 13: Final pass - ensure no "in FIG." without number
     def fix_fig_without_number(match):
@@ -397,12 +525,14 @@ def fix_all_figure_references(text):
         fig_num = get_figure_number_from_context(context)
         return f"in FIG. {fig_num}"
     
-    text = re.sub(r'in\s+FIG\.(?!\s*\d)', fix_fig_without_number, text, flags=re.IGNORECASE)
+    if has_fig:
+        text = RE_IN_FIG_NO_NUM.sub(fix_fig_without_number, text)
     
     # STEP 14: Clean up any double spaces or formatting issues from insertions
-    text = re.sub(r'FIG\.\s+(\d+)\s*,\s*,', r'FIG. \1,', text)
-    text = re.sub(r'FIG\.\s+(\d+)\s*\.\s*\.', r'FIG. \1.', text)
-    text = re.sub(r'\s{2,}', ' ', text)
+    if has_fig:
+        text = RE_FIG_DOUBLE_PUNCT.sub(r'FIG. \1\2\3', text)
+    # Single newlines must survive for parse_sections, so no ' '.join(text.split())
+    text = RE_MULTI_SPACE.sub(' ', text)
     
     return text
 
@@ -420,42 +550,58 @@ ARTIFACTS = [
     r'IMAGE\s*PLACEHOLDER',
     r'Patent\s+Figures\s*\([^)]+\)',
 ]
+ARTIFACT_RE = re.compile('|'.join(f'(?:{p})' for p in ARTIFACTS), re.IGNORECASE)
+# Runs of spaces/tabs; a lone space is skipped since it would be replaced by itself
+RE_HSPACE = re.compile(r' [ \t]+|\t[ \t]*')
+RE_EXCESS_NEWLINES = re.compile(r'\n{4,}')
+RE_DUP_SECTION_NUM = re.compile(r'\((\d+)\)\s*\(\1\)')
 
 def clean_text(text):
     """Remove artifacts and normalize whitespace."""
-    for p in ARTIFACTS:
-        text = re.sub(p, '', text, flags=re.IGNORECASE)
-    text = re.sub(r'[ \t]+', ' ', text)
-    text = re.sub(r'\n{4,}', '\n\n\n', text)
-    text = re.sub(r'\((\d+)\)\s*\(\1\)', r'(\1)', text)  # Fix duplicate section numbers
+    text = ARTIFACT_RE.sub('', text)
+    text = RE_HSPACE.sub(' ', text)
+    text = RE_EXCESS_NEWLINES.sub('\n\n\n', text)
+    text = RE_DUP_SECTION_NUM.sub(r'(\1)', text)  # Fix duplicate section numbers
     return text.strip()
 
+# Broken Unicode symbols and their ASCII replacements
+SYMBOLS = {
+    '■': '', '□': '', '●': '*', '○': '*',
+    '→': '->', '←': '<-', '≥': '>=', '≤': '<=',
+    '≠': '!=', '×': '*', '÷': '/', '±': '+/-',
+    'α': 'alpha', 'β': 'beta', 'γ': 'gamma', 'δ': 'delta',
+    'ε': 'epsilon', 'θ': 'theta', 'λ': 'lambda', 'μ': 'mu',
+    'π': 'pi', 'σ': 'sigma', 'Σ': 'SUM', '∞': 'inf',
+    '√': 'sqrt', '∈': 'in', '⊕': '+', '‖': '||',
+    '—': '-', '–': '-', '\u201c': '"', '\u201d': '"',
+    '\u2018': "'", '\u2019': "'", '…': '...', '\u00a0': ' ',
+}
+XML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;'}
+
+# fix_symbols followed by XML escaping, composed into a single mapping for clean_for_pdf
+PDF_REPLACEMENTS = {**XML_ESCAPES, **{k: ''.join(XML_ESCAPES.get(c, c) for c in v) for k, v in SYMBOLS.items()}}
+
+# One character class per mapping: the scan runs in C and only hits call back,
+# where str.translate with a dict does a lookup for every non-ASCII character
+SYMBOL_RE = re.compile('[' + ''.join(map(re.escape, SYMBOLS)) + ']')
+PDF_RE = re.compile('[' + ''.join(map(re.escape, PDF_REPLACEMENTS)) + ']')
+
 def fix_symbols(text):
-    """Replace broken Unicode symbols."""
-    syms = [
-        ('■', ''), ('□', ''), ('●', '*'), ('○', '*'),
-        ('→', '->'), ('←', '<-'), ('≥', '>='), ('≤', '<='),
-        ('≠', '!='), ('×', '*'), ('÷', '/'), ('±', '+/-'),
-        ('α', 'alpha'), ('β', 'beta'), ('γ', 'gamma'), ('δ', 'delta'),
-        ('ε', 'epsilon'), ('θ', 'theta'), ('λ', 'lambda'), ('μ', 'mu'),
-        ('π', 'pi'), ('σ', 'sigma'), ('Σ', 'SUM'), ('∞', 'inf'),
-        ('√', 'sqrt'), ('∈', 'in'), ('⊕', '+'), ('‖', '||'),
-        ('—', '-'), ('–', '-'), ('"', '"'), ('"', '"'),
-        (''', "'"), (''', "'"), ('…', '...'),
-    ]
-    for old, new in syms:
-        text = text.replace(old, new)
-    return text
+    """Replace broken Unicode symbols (single regex pass; every symbol is non-ASCII)."""
+    if text.isascii():
+        return text
+    return SYMBOL_RE.sub(lambda m: SYMBOLS[m.group()], text)
 
+@lru_cache(maxsize=4096)
 def clean_for_pdf(text):
     """Full cleaning pipeline."""
     if not text:
         return ""
     text = clean_text(text)
     text = fix_all_figure_references(text)
-    text = fix_symbols(text)
-    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-    text = text.encode('ascii', 'ignore').decode('ascii')
+    text = PDF_RE.sub(lambda m: PDF_REPLACEMENTS[m.group()], text)
+    if not text.isascii():
+        text = text.encode('ascii', 'ignore').decode('ascii')
     return text.strip()
 
 print("✓ Cleaning functions defined")
@@ -464,8 +610,9 @@ print("✓ Cleaning functions defined")
 # CELL 7: WIPO-COMPLIANT STYLES
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def create_wipo_styles():
-    """Create strict WIPO/PCT compliant paragraph styles."""
+    """Create strict WIPO/PCT compliant paragraph styles (built once, shared; do not mutate)."""
     styles = getSampleStyleSheet()
     
     # Document Title - Centered, Bold, 14pt
@@ -704,9 +851,7 @@ def extract_text(pdf_path):
         raise FileNotFoundError(f"Not found: {pdf_path}")
     
     doc = fitz.open(pdf_path)
-    text = ""
-    for i in range(len(doc)):
-        text += doc[i].get_text("text") + "\n\n"
+    text = "".join(page.get_text("text") + "\n\n" for page in doc)
     doc.close()
     
     text = clean_text(text)
@@ -716,6 +861,34 @@ def extract_text(pdf_path):
     print(f"   ✓ {len(text):,} characters")
     return text
 
+# Embedded image formats written to disk as extracted, with their file extension
+RAW_IMAGE_EXTS = {'png': 'png', 'jpeg': 'jpg'}
+
+def _render_page(job):
+    """Render one page at 300 DPI and save it; returns (width, height)."""
+    pdf_path, pg, path = job
+    doc = fitz.open(pdf_path)
+    pix = doc[pg].get_pixmap(matrix=fitz.Matrix(300/72, 300/72))
+    pix.save(path)
+    doc.close()
+    return pix.width, pix.height
+
+def process_map(fn, jobs):
+    """Map fn over jobs in worker processes, falling back to a serial map."""
+    if len(jobs) > 1 and (os.cpu_count() or 1) > 1:
+        # Prefer fork: spawn/forkserver workers cannot import functions defined in a notebook
+        context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context) as pool:
+                return list(pool.map(fn, jobs))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"   ⚠ Worker processes unavailable ({e}), running serially")
+    return list(map(fn, jobs))
+
+def render_pages(pdf_path, jobs):
+    """Rasterize pages in worker processes (each opens its own document)."""
+    return process_map(_render_page, [(pdf_path, pg, path) for pg, path in jobs])
+
 def extract_figures(pdf_path, output_dir="figures"):
     """Extract figures at high resolution."""
     print(f"\n🖼️  Extracting figures: {pdf_path}")
@@ -728,35 +901,46 @@ def extract_figures(pdf_path, output_dir="figures"):
     figures = []
     count = 0
     
-    # Try embedded images
+    # Try embedded images (each xref once, even if several pages show it)
+    seen_xrefs = set()
     for pg in range(len(doc)):
         for img in doc[pg].get_images(full=True):
+            if img[0] in seen_xrefs:
+                continue
+            seen_xrefs.add(img[0])
             try:
                 base = doc.extract_image(img[0])
-                pil = PILImage.open(BytesIO(base["image"]))
-                if pil.width < 100 or pil.height < 100:
+                width, height = base["width"], base["height"]
+                if width < 100 or height < 100:
                     continue
-                count += 1
-                path = f"{output_dir}/fig_{count:02d}.png"
-                if pil.mode in ('RGBA', 'P'):
-                    pil = pil.convert('RGB')
-                pil.save(path, quality=95)
-                figures.append({'path': path, 'width': pil.width, 'height': pil.height, 'index': count})
-                print(f"   ✓ FIG. {count}: {pil.width}x{pil.height}")
+                if base["ext"] in RAW_IMAGE_EXTS and base["colorspace"] in (1, 3):
+                    # Grey/RGB PNG or JPEG: keep the stored bytes, no decode/re-encode.
+                    # verify() checks the header (and PNG chunk CRCs) so corrupt streams are skipped.
+                    PILImage.open(BytesIO(base["image"])).verify()
+                    count += 1
+                    path = f"{output_dir}/fig_{count:02d}.{RAW_IMAGE_EXTS[base['ext']]}"
+                    with open(path, 'wb') as f:
+                        f.write(base["image"])
+                else:
+                    pil = PILImage.open(BytesIO(base["image"]))
+                    count += 1
+                    path = f"{output_dir}/fig_{count:02d}.png"
+                    if pil.mode in ('RGBA', 'P'):
+                        pil = pil.convert('RGB')
+                    pil.save(path, quality=95)
+                figures.append({'path': path, 'width': width, 'height': height, 'index': count})
+                print(f"   ✓ FIG. {count}: {width}x{height}")
             except:
                 pass
     
     # Fallback: render pages
     if not figures:
         print("   ℹ Rendering pages as figures...")
-        for pg in range(len(doc)):
-            mat = fitz.Matrix(300/72, 300/72)
-            pix = doc[pg].get_pixmap(matrix=mat)
+        jobs = [(pg, f"{output_dir}/fig_{pg + 1:02d}.png") for pg in range(len(doc))]
+        for (pg, path), (width, height) in zip(jobs, render_pages(pdf_path, jobs)):
             count = pg + 1
-            path = f"{output_dir}/fig_{count:02d}.png"
-            pix.save(path)
-            figures.append({'path': path, 'width': pix.width, 'height': pix.height, 'index': count})
-            print(f"   ✓ FIG. {count}: {pix.width}x{pix.height}")
+            figures.append({'path': path, 'width': width, 'height': height, 'index': count})
+            print(f"   ✓ FIG. {count}: {width}x{height}")
     
     doc.close()
     print(f"   ✓ Total: {len(figures)} figures")
@@ -779,26 +963,32 @@ SECTION_MARKERS = [
     (r'BEST\s*MODE', 'best_mode'), (r'PCT|WIPO|BOILERPLATE', 'boilerplate'),
 ]
 
+# All marker patterns in one alternation, tried in list order; group n is
+# SECTION_MARKERS[n - 1]. Matched against line.upper() rather than with re.I
+# because upper() also expands ligatures (ﬁ → FI) from PDF text.
+SECTION_RE = re.compile('|'.join(f'(\\(?\\d*\\)?\\s*{p})' for p, _ in SECTION_MARKERS))
+SECTION_KEYS = [None] + [key for _, key in SECTION_MARKERS]
+
 def parse_sections(text):
     """Parse document into sections."""
     print("\n📋 Parsing sections...")
-    sections = {}
+    parts = defaultdict(list)  # section key -> text blocks, joined once at the end
     lines = text.split('\n')
     current = 'preamble'
     content = []
     
     for line in lines:
-        upper = line.strip().upper()
+        stripped = line.strip()
         found = None
-        for pattern, key in SECTION_MARKERS:
-            if re.match(f'^\\(?\\d*\\)?\\s*{pattern}', upper) and len(line.strip()) < 120:
-                found = key
-                break
+        if len(stripped) < 120:
+            m = SECTION_RE.match(stripped.upper())
+            if m:
+                found = SECTION_KEYS[m.lastindex]
         if found:
             if content:
                 txt = '\n'.join(content).strip()
-                if txt and (current not in sections or current == 'claims'):
-                    sections[current] = sections.get(current, '') + ('\n\n' if current in sections else '') + txt
+                if txt and (current not in parts or current == 'claims'):
+                    parts[current].append(txt)
             current = found
             content = []
         else:
@@ -806,47 +996,67 @@ def parse_sections(text):
     
     if content:
         txt = '\n'.join(content).strip()
-        if txt and current not in sections:
-            sections[current] = txt
+        if txt and current not in parts:
+            parts[current].append(txt)
     
+    sections = {k: '\n\n'.join(v) for k, v in parts.items()}
     for k in sections:
         if k != 'preamble':
             print(f"   ✓ {k}: {len(sections[k]):,} chars")
     
     return sections
 
+# Claim extraction patterns
+RE_CLAIMS_START = re.compile(r'(?:CLAIMS?|WHAT\s*IS\s*CLAIMED)[^\n]*\n(.*)', re.I | re.S)
+RE_CLAIM_START = re.compile(r'(?:^|\n)\s*(?:CLAIM\s*)?(\d{1,2})[\.\s—\-:]+(?=[A-Z])', re.I)
+# Newlines that end a claim: the next claim number or a "(N) HEADING"
+RE_CLAIM_END = re.compile(r'\n(?=\s*(?:CLAIM\s*)?\d{1,2}[\.\s—\-:]+[A-Z]|\s*\(\d+\)\s*[A-Z])', re.I)
+RE_WHITESPACE = re.compile(r'\s+')
+RE_TRAILING_HEADING = re.compile(r'\s*\(\d+\)\s*[A-Z][A-Z\s]+$')
+RE_TRAILING_SECTION = re.compile(r'\s*(INDUSTRIAL|BEST\s*MODE|PCT|WIPO).*$', re.I)
+RE_DEPENDENT_CLAIM = re.compile(
+    r'(?:claim\s+\d+|according\s+to\s+claim|as\s+(?:claimed|recited)\s+in\s+claim|of\s+claim\s+\d+)',
+    re.I
+)
+
+def iter_claims(search):
+    """
+    Yield (number, raw text) for each claim. Claim ends are found in one
+    scan and each claim runs to the first end after its number, instead of
+    a lazy match that tests the end lookahead at every character.
+    """
+    ends = [m.start() for m in RE_CLAIM_END.finditer(search)]
+    pos = 0
+    while True:
+        m = RE_CLAIM_START.search(search, pos)
+        if not m:
+            return
+        i = bisect_right(ends, m.end())
+        pos = ends[i] if i < len(ends) else len(search)
+        yield int(m.group(1)), search[m.end():pos]
+
 def extract_claims(text):
     """Extract claims with proper structure detection."""
     print("\n📋 Extracting claims...")
-    claims = []
-    seen = set()
+    claims_by_num = {}
     
-    match = re.search(r'(?:CLAIMS?|WHAT\s*IS\s*CLAIMED)[^\n]*\n(.*)', text, re.I | re.S)
+    match = RE_CLAIMS_START.search(text)
     search = match.group(1) if match else text
     
-    # Pattern for claims
-    pattern = re.compile(
-        r'(?:^|\n)\s*(?:CLAIM\s*)?(\d{1,2})[\.\s—\-:]+([A-Z].*?)(?=\n\s*(?:CLAIM\s*)?\d{1,2}[\.\s—\-:]+[A-Z]|\n\s*\(\d+\)\s*[A-Z]|\Z)',
-        re.S | re.I
-    )
-    
-    for m in pattern.finditer(search):
-        num = int(m.group(1))
-        txt = re.sub(r'\s+', ' ', m.group(2)).strip()
+    for num, raw in iter_claims(search):
+        if num in claims_by_num or num > 65:
+            continue
+        txt = RE_WHITESPACE.sub(' ', raw).strip()
         # Remove trailing section headers
-        txt = re.sub(r'\s*\(\d+\)\s*[A-Z][A-Z\s]+$', '', txt)
-        txt = re.sub(r'\s*(INDUSTRIAL|BEST\s*MODE|PCT|WIPO).*$', '', txt, flags=re.I)
+        txt = RE_TRAILING_HEADING.sub('', txt)
+        txt = RE_TRAILING_SECTION.sub('', txt)
         
-        if num not in seen and num <= 65 and len(txt) >= 20:
-            seen.add(num)
+        if len(txt) >= 20:
             # Determine if dependent (references another claim)
-            is_dep = bool(re.search(
-                r'(?:claim\s+\d+|according\s+to\s+claim|as\s+(?:claimed|recited)\s+in\s+claim|of\s+claim\s+\d+)',
-                txt, re.I
-            ))
-            claims.append({'number': num, 'text': txt, 'is_dependent': is_dep})
+            is_dep = bool(RE_DEPENDENT_CLAIM.search(txt))
+            claims_by_num[num] = {'number': num, 'text': txt, 'is_dependent': is_dep}
     
-    claims.sort(key=lambda x: x['number'])
+    claims = [claims_by_num[num] for num in sorted(claims_by_num)]
     print(f"   ✓ {len(claims)} claims extracted")
     if claims:
         indep = sum(1 for c in claims if not c['is_dependent'])
@@ -861,32 +1071,40 @@ print("✓ Parsing functions defined")
 # CELL 12: PARAGRAPH BUILDER
 # =============================================================================
 
-def make_paragraphs(content, styles, style_name='PatentBody'):
-    """Convert text to paragraphs with all fixes applied."""
-    result = []
+RE_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+def clean_paragraphs(content):
+    """Split text into paragraphs with all fixes applied."""
+    paragraphs = []
     if not content:
-        return result
+        return paragraphs
     
     content = clean_text(content)
     content = fix_all_figure_references(content)
     content = fix_symbols(content)
     
-    for p in re.split(r'\n\s*\n', content):
+    for p in RE_PARAGRAPH_BREAK.split(content):
         p = p.strip()
         if p and len(p) > 5:
             cleaned = clean_for_pdf(p)
             if cleaned:
-                try:
-                    result.append(Paragraph(cleaned, styles[style_name]))
-                except Exception as e:
-                    # Try splitting on sentences
-                    for s in cleaned.split('. '):
-                        if s.strip():
-                            try:
-                                result.append(Paragraph(s.strip() + '.', styles[style_name]))
-                            except:
-                                pass
-    return result
+                paragraphs.append(cleaned)
+    return paragraphs
+
+@lru_cache(maxsize=4096)
+def parse_paragraph(text, style):
+    """Parse text into a Paragraph once per style (same bound as clean_for_pdf)."""
+    return Paragraph(text, style)
+
+def cached_paragraph(text, style):
+    """Parsed Paragraph for text; each call returns a fresh shallow copy."""
+    return copy.copy(parse_paragraph(text, style))
+
+def make_paragraphs(paragraphs, styles, style_name='PatentBody'):
+    """Convert cleaned paragraphs (from clean_paragraphs) to Paragraph flowables."""
+    # clean_for_pdf escapes every &, < and >, so there is no markup left to fail parsing
+    style = styles[style_name]
+    return [cached_paragraph(cleaned, style) for cleaned in paragraphs]
 
 print("✓ Paragraph builder defined")
 
@@ -894,6 +1112,29 @@ print("✓ Paragraph builder defined")
 # CELL 13: MAIN PDF BUILDER
 # =============================================================================
 
+BOILERPLATE_TEXT = [
+    "This application is filed pursuant to the Patent Cooperation Treaty (PCT) and complies with all World Intellectual Property Organization (WIPO) requirements for international patent applications.",
+    "PRIORITY CLAIMS: This application claims priority from provisional applications filed in accordance with applicable patent laws.",
+    "DESIGNATED STATES: All PCT contracting states and regional patent offices are designated for the purposes of this international application.",
+    "INDUSTRIAL APPLICABILITY: The invention is industrially applicable in the fields of media technology, artificial intelligence, machine learning, content management systems, digital rights management, and quality control systems.",
+    "DISCLOSURE SUFFICIENCY: The specification contains adequate disclosure for a person of ordinary skill in the art to make and use the invention without undue experimentation.",
+    "SEQUENCE LISTING: Not applicable.",
+    "BIOLOGICAL MATERIAL DEPOSIT: Not applicable.",
+]
+
+CONCLUSION_TEXT = [
+    "The embodiments described herein are illustrative and not limiting. Variations, substitutions, and modifications can be made by those skilled in the art without departing from the scope of the invention as defined by the claims.",
+    "The scope of the invention is not limited to the specific embodiments described but extends to all equivalents and variations that fall within the spirit of the claims.",
+    "Reference numerals, figure labels, and specific parameter values are provided for illustration only and should not be construed as limiting the broader inventive concepts disclosed herein.",
+    "All publications, patents, and patent applications cited in this specification are incorporated by reference in their entirety.",
+]
+
+# Static text cleaned once at import; clean_for_pdf is deterministic
+FIGURE_DESCS = [clean_for_pdf(f"{fig['label']} - {fig['title']}: {fig['desc']}") for fig in FIGURES]
+FIGURE_CAPTIONS = [clean_for_pdf(f"{fig['label']} - {fig['title']}") for fig in FIGURES]
+BOILERPLATE_PARAS = [clean_for_pdf(para) for para in BOILERPLATE_TEXT]
+CONCLUSION_PARAS = [clean_for_pdf(para) for para in CONCLUSION_TEXT]
+
 def build_patent_pdf(sections, claims, figure_files, output_path):
     """Build complete WIPO-compliant patent PDF."""
     print(f"\n📄 Building: {output_path}")
@@ -901,6 +1142,11 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
     styles = create_wipo_styles()
     num_figs = min(len(figure_files), 17) if figure_files else 17
     
+    # Clean all body sections up front
+    body_keys = ('abstract', 'field', 'background', 'summary', 'detailed', 'enablement',
+                 'security', 'copyright', 'alternatives', 'secondary', 'industrial', 'best_mode')
+    body_text = {k: clean_paragraphs(sections[k]) for k in body_keys if k in sections}
+    
     doc = SimpleDocTemplate(
         output_path,
         pagesize=A4,
@@ -916,23 +1162,23 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
     # TITLE PAGE
     # =========================================================================
     story.append(Spacer(1, 1.5*inch))
-    story.append(Paragraph("INTERNATIONAL PATENT APPLICATION", styles['SectionHeading']))
+    story.append(cached_paragraph("INTERNATIONAL PATENT APPLICATION", styles['SectionHeading']))
     story.append(Spacer(1, 0.25*inch))
     
     main_title = "SEMANTIC PROVENANCE INTELLIGENCE SYSTEM FOR MULTI-DIMENSIONAL MEDIA CONTENT ANALYSIS AND CREATIVE QUALITY CONTROL"
-    story.append(Paragraph(main_title, styles['PatentTitle']))
+    story.append(cached_paragraph(main_title, styles['PatentTitle']))
     
     story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("CREATIVE DNA ANALYSIS ALGORITHM", styles['SubsectionHeading']))
+    story.append(cached_paragraph("CREATIVE DNA ANALYSIS ALGORITHM", styles['SubsectionHeading']))
     story.append(Spacer(1, 0.25*inch))
-    story.append(Paragraph("PCT/WIPO Compliant Specification", styles['PatentBody']))
-    story.append(Paragraph("Attorney-Ready Filing Document", styles['PatentBody']))
+    story.append(cached_paragraph("PCT/WIPO Compliant Specification", styles['PatentBody']))
+    story.append(cached_paragraph("Attorney-Ready Filing Document", styles['PatentBody']))
     story.append(PageBreak())
     
     # =========================================================================
     # TABLE OF CONTENTS
     # =========================================================================
-    story.append(Paragraph("TABLE OF CONTENTS", styles['SectionHeading']))
+    story.append(cached_paragraph("TABLE OF CONTENTS", styles['SectionHeading']))
     story.append(Spacer(1, 12))
     
     toc_entries = [
@@ -957,140 +1203,139 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
     ]
     
     for entry in toc_entries:
-        story.append(Paragraph(entry, styles['TOCEntry']))
+        story.append(cached_paragraph(entry, styles['TOCEntry']))
     
     story.append(PageBreak())
     
     # =========================================================================
     # (1) TITLE
     # =========================================================================
-    story.append(Paragraph("(1) TITLE OF THE INVENTION", styles['SectionHeading']))
-    story.append(Paragraph(main_title, styles['PatentTitle']))
+    story.append(cached_paragraph("(1) TITLE OF THE INVENTION", styles['SectionHeading']))
+    story.append(cached_paragraph(main_title, styles['PatentTitle']))
     story.append(Spacer(1, 24))
     
     # =========================================================================
     # (2) ABSTRACT
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(2) ABSTRACT", styles['SectionHeading']))
-    if 'abstract' in sections:
-        story.extend(make_paragraphs(sections['abstract'], styles, 'AbstractText'))
+    story.append(cached_paragraph("(2) ABSTRACT", styles['SectionHeading']))
+    if 'abstract' in body_text:
+        story.extend(make_paragraphs(body_text['abstract'], styles, 'AbstractText'))
     
     # =========================================================================
     # (3) FIELD
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(3) FIELD OF THE INVENTION", styles['SectionHeading']))
-    if 'field' in sections:
-        story.extend(make_paragraphs(sections['field'], styles))
+    story.append(cached_paragraph("(3) FIELD OF THE INVENTION", styles['SectionHeading']))
+    if 'field' in body_text:
+        story.extend(make_paragraphs(body_text['field'], styles))
     
     # =========================================================================
     # (4) BACKGROUND
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(4) BACKGROUND OF THE INVENTION", styles['SectionHeading']))
-    if 'background' in sections:
-        story.extend(make_paragraphs(sections['background'], styles))
+    story.append(cached_paragraph("(4) BACKGROUND OF THE INVENTION", styles['SectionHeading']))
+    if 'background' in body_text:
+        story.extend(make_paragraphs(body_text['background'], styles))
     
     # =========================================================================
     # (5) SUMMARY
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(5) SUMMARY OF THE INVENTION", styles['SectionHeading']))
-    if 'summary' in sections:
-        story.extend(make_paragraphs(sections['summary'], styles))
+    story.append(cached_paragraph("(5) SUMMARY OF THE INVENTION", styles['SectionHeading']))
+    if 'summary' in body_text:
+        story.extend(make_paragraphs(body_text['summary'], styles))
     
     # Key formulas
     story.append(Spacer(1, 12))
-    story.append(Paragraph("<b>Key Mathematical Formulations:</b>", styles['SubsectionHeading']))
-    story.append(Paragraph(FORMULAS['sdf'], styles['Formula']))
-    story.append(Paragraph(FORMULAS['cosine'], styles['Formula']))
+    story.append(cached_paragraph("<b>Key Mathematical Formulations:</b>", styles['SubsectionHeading']))
+    story.append(cached_paragraph(FORMULAS['sdf'], styles['Formula']))
+    story.append(cached_paragraph(FORMULAS['cosine'], styles['Formula']))
     
     # =========================================================================
     # (6) BRIEF DESCRIPTION OF THE DRAWINGS
     # Uses exact same order as Section (17)
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(6) BRIEF DESCRIPTION OF THE DRAWINGS", styles['SectionHeading']))
+    story.append(cached_paragraph("(6) BRIEF DESCRIPTION OF THE DRAWINGS", styles['SectionHeading']))
     
-    for fig in FIGURES[:num_figs]:
-        desc_text = f"{fig['label']} - {fig['title']}: {fig['desc']}"
-        story.append(Paragraph(clean_for_pdf(desc_text), styles['FigureDesc']))
+    for desc in FIGURE_DESCS[:num_figs]:
+        story.append(cached_paragraph(desc, styles['FigureDesc']))
     
     # =========================================================================
     # (7) DETAILED DESCRIPTION
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(7) DETAILED DESCRIPTION OF THE INVENTION", styles['SectionHeading']))
-    if 'detailed' in sections:
-        story.extend(make_paragraphs(sections['detailed'], styles))
+    story.append(cached_paragraph("(7) DETAILED DESCRIPTION OF THE INVENTION", styles['SectionHeading']))
+    if 'detailed' in body_text:
+        story.extend(make_paragraphs(body_text['detailed'], styles))
     
     # Mathematical Framework
     story.append(Spacer(1, 12))
-    story.append(Paragraph("<b>7.1 Mathematical Framework</b>", styles['SubsectionHeading']))
-    story.append(Paragraph(FORMULAS['distance'], styles['Formula']))
-    story.append(Paragraph(FORMULAS['drift'], styles['Formula']))
-    story.append(Paragraph(FORMULAS['weighted'], styles['Formula']))
-    story.append(Paragraph(FORMULAS['attention'], styles['Formula']))
+    story.append(cached_paragraph("<b>7.1 Mathematical Framework</b>", styles['SubsectionHeading']))
+    story.append(cached_paragraph(FORMULAS['distance'], styles['Formula']))
+    story.append(cached_paragraph(FORMULAS['drift'], styles['Formula']))
+    story.append(cached_paragraph(FORMULAS['weighted'], styles['Formula']))
+    story.append(cached_paragraph(FORMULAS['attention'], styles['Formula']))
     
     # Drift Table
     story.append(Spacer(1, 12))
-    story.append(Paragraph("<b>7.2 Semantic Drift Monitoring</b>", styles['SubsectionHeading']))
-    story.append(Paragraph("Table 1: Semantic Drift Comparison by Component Vector", styles['PatentBody']))
+    story.append(cached_paragraph("<b>7.2 Semantic Drift Monitoring</b>", styles['SubsectionHeading']))
+    story.append(cached_paragraph("Table 1: Semantic Drift Comparison by Component Vector", styles['PatentBody']))
     story.append(build_table(DRIFT_TABLE, [1.3*inch, 0.5*inch, 0.65*inch, 0.65*inch, 0.6*inch, 0.65*inch]))
     
     # QC Table
     story.append(Spacer(1, 12))
-    story.append(Paragraph("<b>7.3 Creative QC Parameter Architecture</b>", styles['SubsectionHeading']))
-    story.append(Paragraph("Table 2: Creative DNA Vector Layout (33 Parameters)", styles['PatentBody']))
+    story.append(cached_paragraph("<b>7.3 Creative QC Parameter Architecture</b>", styles['SubsectionHeading']))
+    story.append(cached_paragraph("Table 2: Creative DNA Vector Layout (33 Parameters)", styles['PatentBody']))
     story.append(build_table(QC_TABLE, [1.3*inch, 0.9*inch, 0.6*inch, 1.1*inch]))
     
     # =========================================================================
     # (8) ENABLEMENT
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(8) ENABLEMENT AND TRAINING PROCEDURES", styles['SectionHeading']))
-    if 'enablement' in sections:
-        story.extend(make_paragraphs(sections['enablement'], styles))
+    story.append(cached_paragraph("(8) ENABLEMENT AND TRAINING PROCEDURES", styles['SectionHeading']))
+    if 'enablement' in body_text:
+        story.extend(make_paragraphs(body_text['enablement'], styles))
     
     # =========================================================================
     # (9) SECURITY
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(9) SECURITY, ANTI-ABUSE, AND ADVERSARIAL ROBUSTNESS", styles['SectionHeading']))
-    if 'security' in sections:
-        story.extend(make_paragraphs(sections['security'], styles))
+    story.append(cached_paragraph("(9) SECURITY, ANTI-ABUSE, AND ADVERSARIAL ROBUSTNESS", styles['SectionHeading']))
+    if 'security' in body_text:
+        story.extend(make_paragraphs(body_text['security'], styles))
     
     # =========================================================================
     # (10) COPYRIGHT
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(10) COPYRIGHT AUTOMATION ENGINE AND RIGHTS LEDGER", styles['SectionHeading']))
-    if 'copyright' in sections:
-        story.extend(make_paragraphs(sections['copyright'], styles))
+    story.append(cached_paragraph("(10) COPYRIGHT AUTOMATION ENGINE AND RIGHTS LEDGER", styles['SectionHeading']))
+    if 'copyright' in body_text:
+        story.extend(make_paragraphs(body_text['copyright'], styles))
     
     # =========================================================================
     # (11) ALTERNATIVES
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(11) ALTERNATIVE IMPLEMENTATIONS AND DEPLOYMENT VARIANTS", styles['SectionHeading']))
-    if 'alternatives' in sections:
-        story.extend(make_paragraphs(sections['alternatives'], styles))
+    story.append(cached_paragraph("(11) ALTERNATIVE IMPLEMENTATIONS AND DEPLOYMENT VARIANTS", styles['SectionHeading']))
+    if 'alternatives' in body_text:
+        story.extend(make_paragraphs(body_text['alternatives'], styles))
     
     # =========================================================================
     # (12) SECONDARY INVENTION
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(12) SECONDARY INVENTION: STANDALONE CREATIVE QC ENGINE", styles['SectionHeading']))
-    if 'secondary' in sections:
-        story.extend(make_paragraphs(sections['secondary'], styles))
+    story.append(cached_paragraph("(12) SECONDARY INVENTION: STANDALONE CREATIVE QC ENGINE", styles['SectionHeading']))
+    if 'secondary' in body_text:
+        story.extend(make_paragraphs(body_text['secondary'], styles))
     
     # =========================================================================
     # (13) CLAIMS - WIPO FORMAT
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(13) CLAIMS", styles['SectionHeading']))
-    story.append(Paragraph("What is claimed is:", styles['ClaimPreamble']))
+    story.append(cached_paragraph("(13) CLAIMS", styles['SectionHeading']))
+    story.append(cached_paragraph("What is claimed is:", styles['ClaimPreamble']))
     
     if claims:
         print(f"   Formatting {len(claims)} claims...")
@@ -1103,7 +1348,7 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
             style_name = 'ClaimDependent' if claim['is_dependent'] else 'ClaimIndependent'
             
             try:
-                story.append(Paragraph(cleaned, styles[style_name]))
+                story.append(cached_paragraph(cleaned, styles[style_name]))
             except Exception as e:
                 print(f"   ⚠ Claim {claim['number']}: {e}")
     
@@ -1111,43 +1356,33 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
     # (14) INDUSTRIAL APPLICABILITY
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(14) INDUSTRIAL APPLICABILITY", styles['SectionHeading']))
-    if 'industrial' in sections:
-        story.extend(make_paragraphs(sections['industrial'], styles))
+    story.append(cached_paragraph("(14) INDUSTRIAL APPLICABILITY", styles['SectionHeading']))
+    if 'industrial' in body_text:
+        story.extend(make_paragraphs(body_text['industrial'], styles))
     
     # =========================================================================
     # (15) BEST MODE
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(15) BEST MODE", styles['SectionHeading']))
-    if 'best_mode' in sections:
-        story.extend(make_paragraphs(sections['best_mode'], styles))
+    story.append(cached_paragraph("(15) BEST MODE", styles['SectionHeading']))
+    if 'best_mode' in body_text:
+        story.extend(make_paragraphs(body_text['best_mode'], styles))
     
     # =========================================================================
     # (16) BOILERPLATE
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(16) PCT/WIPO COMPLIANCE DECLARATIONS", styles['SectionHeading']))
-    
-    boilerplate_text = [
-        "This application is filed pursuant to the Patent Cooperation Treaty (PCT) and complies with all World Intellectual Property Organization (WIPO) requirements for international patent applications.",
-        "PRIORITY CLAIMS: This application claims priority from provisional applications filed in accordance with applicable patent laws.",
-        "DESIGNATED STATES: All PCT contracting states and regional patent offices are designated for the purposes of this international application.",
-        "INDUSTRIAL APPLICABILITY: The invention is industrially applicable in the fields of media technology, artificial intelligence, machine learning, content management systems, digital rights management, and quality control systems.",
-        "DISCLOSURE SUFFICIENCY: The specification contains adequate disclosure for a person of ordinary skill in the art to make and use the invention without undue experimentation.",
-        "SEQUENCE LISTING: Not applicable.",
-        "BIOLOGICAL MATERIAL DEPOSIT: Not applicable.",
-    ]
+    story.append(cached_paragraph("(16) PCT/WIPO COMPLIANCE DECLARATIONS", styles['SectionHeading']))
     
-    for para in boilerplate_text:
-        story.append(Paragraph(clean_for_pdf(para), styles['Boilerplate']))
+    for para in BOILERPLATE_PARAS:
+        story.append(cached_paragraph(para, styles['Boilerplate']))
     
     # =========================================================================
     # (17) FIGURES - Same order as Section (6)
     # =========================================================================
     if figure_files:
         story.append(PageBreak())
-        story.append(Paragraph("(17) FIGURES", styles['SectionHeading']))
+        story.append(cached_paragraph("(17) FIGURES", styles['SectionHeading']))
         
         for idx in range(min(len(figure_files), num_figs)):
             story.append(PageBreak())
@@ -1156,18 +1391,22 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
             fig_file = figure_files[idx]
             
             # Caption: "FIG. X - Title"
-            caption = f"{fig_def['label']} - {fig_def['title']}"
-            story.append(Paragraph(clean_for_pdf(caption), styles['FigureCaption']))
+            if idx < len(FIGURE_CAPTIONS):
+                caption = FIGURE_CAPTIONS[idx]
+            else:
+                caption = clean_for_pdf(f"{fig_def['label']} - {fig_def['title']}")
+            story.append(cached_paragraph(caption, styles['FigureCaption']))
             
             # Image
             max_w = CONTENT_WIDTH
             max_h = CONTENT_HEIGHT - 1.5 * inch
             
             try:
-                pil = PILImage.open(fig_file['path'])
-                w, h = pil.size
+                # Size recorded by extract_figures; lazy=0 still reads the file header here,
+                # so a missing/unreadable figure falls through to the placeholder below
+                w, h = fig_file['width'], fig_file['height']
                 scale = min(max_w / w, max_h / h, 1.0)
-                story.append(Image(fig_file['path'], width=w * scale, height=h * scale))
+                story.append(Image(fig_file['path'], width=w * scale, height=h * scale, lazy=0))
             except Exception as e:
                 print(f"   ⚠ {fig_def['label']}: {e}")
                 story.append(Paragraph(f"[{fig_def['label']} - Image not available]", styles['PatentBody']))
@@ -1176,17 +1415,10 @@ def build_patent_pdf(sections, claims, figure_files, output_path):
     # (18) CONCLUSION
     # =========================================================================
     story.append(PageBreak())
-    story.append(Paragraph("(18) CONCLUSION", styles['SectionHeading']))
-    
-    conclusion_text = [
-        "The embodiments described herein are illustrative and not limiting. Variations, substitutions, and modifications can be made by those skilled in the art without departing from the scope of the invention as defined by the claims.",
-        "The scope of the invention is not limited to the specific embodiments described but extends to all equivalents and variations that fall within the spirit of the claims.",
-        "Reference numerals, figure labels, and specific parameter values are provided for illustration only and should not be construed as limiting the broader inventive concepts disclosed herein.",
-        "All publications, patents, and patent applications cited in this specification are incorporated by reference in their entirety.",
-    ]
+    story.append(cached_paragraph("(18) CONCLUSION", styles['SectionHeading']))
     
-    for para in conclusion_text:
-        story.append(Paragraph(clean_for_pdf(para), styles['Boilerplate']))
+    for para in CONCLUSION_PARAS:
+        story.append(cached_paragraph(para, styles['Boilerplate']))
     
     # =========================================================================
     # BUILD PDF